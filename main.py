@@ -7,15 +7,20 @@ MicroSIP Caller Toast (Demo, Imaginary DB) — styled v5
 - Safe offline demo. No real DB or network.
 """
 
-import sys, os, re, html, csv
+from __future__ import annotations
+
+import sys, os, re, html, csv, pickle, atexit
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt, QTimer, QPoint, QSize
-from PySide6.QtGui import QGuiApplication, QPixmap, QColor
-from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QLabel, QPushButton,
-    QHBoxLayout, QGraphicsDropShadowEffect, QSizePolicy
-)
+# PySide6 is imported lazily inside the Qt-facing functions: importing it
+# costs hundreds of ms, and paths that never show a toast shouldn't pay it.
+if TYPE_CHECKING:
+    from PySide6.QtCore import QPoint, QSize
+    from PySide6.QtGui import QColor, QPixmap
 
 # === CONFIG ===
 URL = "https://test.com/2822031693"
@@ -71,10 +76,36 @@ LABELS = {
     2: [{"name":"VIP","color":"#E5CCFF"},{"name":"Net-30","color":"#FFF3CD"}],
 }
 
+# The demo tables are read-only at runtime: intern the contact keys (already
+# normalized digit strings, so hash/eq on lookups hits the interned object),
+# freeze row lists into tuples and wrap the dicts in mapping proxies so they
+# can't be mutated by accident.
+CONTACTS  = {sys.intern(k): v for k, v in CONTACTS.items()}
+CUSTOMERS = MappingProxyType(CUSTOMERS)
+PROFILES  = MappingProxyType(PROFILES)
+SERVICES  = MappingProxyType({cid: tuple(rows) for cid, rows in SERVICES.items()})
+LABELS    = MappingProxyType({cid: tuple(rows) for cid, rows in LABELS.items()})
+
+# SERVICES is static, so the unpaid totals can be summed once at load
+# instead of rescanning paid rows on every lookup
+_UNPAID_BY_CID = {
+    cid: sum(row["amount"] for row in rows if not row.get("paid", False))
+    for cid, rows in SERVICES.items()
+}
+
 # === HELPERS ===
+_CTRL_RE = re.compile(r"[\x00-\x1F\x7F]")
+_TAG_RE  = re.compile(r"<[^>]+>", re.S)
+_WS_RE   = re.compile(r"\s+")
+_STRIP_WS_TABLE = str.maketrans("", "", " \t")
+
 def fs(px):  # UI font scale
     return f"{int(px * 1.2)}px"
 
+# the two sizes the renderers use constantly; computed once instead of per call
+_FS11 = fs(11)
+_FS12 = fs(12)
+
 def log(msg):
     line = f"{datetime.now()} - {msg}"
     print(line)
@@ -84,29 +115,72 @@ def log(msg):
     except Exception:
         pass
 
+# deletes every non-digit ASCII char in one C pass; unicode leftovers are rare
+_NON_DIGIT_ASCII = str.maketrans("", "", "".join(chr(i) for i in range(128) if not chr(i).isdigit()))
+
 def norm_phone(p: str) -> str:
-    return "".join(ch for ch in p if ch.isdigit())
+    s = p.translate(_NON_DIGIT_ASCII)
+    if not s.isascii():  # unicode digits/separators survived the ASCII table
+        s = "".join(filter(str.isdigit, s))
+    return s
 
 def bottom_right_pos(widget_size: QSize) -> QPoint:
+    from PySide6.QtCore import QPoint
+    from PySide6.QtGui import QGuiApplication
     screen = QGuiApplication.primaryScreen().availableGeometry()
     x = screen.right() - widget_size.width() - 24
     y = screen.bottom() - widget_size.height() - 24
     return QPoint(x, y)
 
 def clean_line(s: str) -> str:
-    s = re.sub(r"[\x00-\x1F\x7F]", "", s)
-    s = s.replace(" ", "").replace("\t", "")
-    return s.strip()
+    return _CTRL_RE.sub("", s).translate(_STRIP_WS_TABLE).strip()
 
 def strip_html(s: str) -> str:
     if not s:
         return ""
-    no_tags = re.sub(r"<[^>]+>", " ", s, flags=re.S)
-    no_tags = re.sub(r"\s+", " ", no_tags).strip()
+    no_tags = _TAG_RE.sub(" ", s)
+    no_tags = _WS_RE.sub(" ", no_tags).strip()
     return html.unescape(no_tags)
 
+_EURO_SWAP = str.maketrans({",": ".", ".": ","})  # swap both in one pass
+
 def euro(amount: float) -> str:
-    return f"€{amount:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    return f"€{amount:,.2f}".translate(_EURO_SWAP)
+
+def _maybe_escape(s: str) -> str:
+    # the C-level containment scan is cheaper than an escaped copy when clean
+    return s if not any(c in s for c in "<>&\"'") else html.escape(s)
+
+# spaces, nbsp variants, dash, dot, parens \u2014 allowed between phone digits
+_SEP_SET = frozenset(" \u00A0\u2007\u202F-.()")
+
+def _scan_phone(text: str, num: str):
+    """Find spans of num in text allowing separator chars between digits.
+    Matches may not touch adjacent digits (same semantics as the old
+    lookaround regex) but skip the regex engine entirely."""
+    spans = []
+    n = len(text)
+    first = num[0]
+    i = text.find(first)
+    while i != -1:
+        if i > 0 and text[i - 1].isdigit():
+            i = text.find(first, i + 1)
+            continue
+        j, ok = i, True
+        for d in num:
+            while j < n and text[j] in _SEP_SET:
+                j += 1
+            if j < n and text[j] == d:
+                j += 1
+            else:
+                ok = False
+                break
+        if ok and not (j < n and text[j].isdigit()):
+            spans.append((i, j))
+            i = text.find(first, j)
+        else:
+            i = text.find(first, i + 1)
+    return spans
 
 def highlight_phone(text: str, num: str, color="lightgreen") -> str:
     """
@@ -116,15 +190,30 @@ def highlight_phone(text: str, num: str, color="lightgreen") -> str:
     """
     if not text or not num:
         return html.escape(text or "")
-    seps = r"[ \u00A0\u2007\u202F\-\.\(\)]*"  # spaces, nbsp variants, dash, dot, parens
-    pattern = r'(?<!\d)' + seps.join(map(re.escape, num)) + r'(?!\d)'
-    import re as _re
     safe = html.escape(text)
-    return _re.sub(pattern,
-                   lambda m: f"<span style='color:{color}; font-weight:bold;'>{m.group(0)}</span>",
-                   safe)
+    spans = _scan_phone(safe, num)
+    if not spans:
+        return safe
+    out, prev = [], 0
+    for start, end in spans:
+        out.append(safe[prev:start])
+        out.append(f"<span style='color:{color}; font-weight:bold;'>{safe[start:end]}</span>")
+        prev = end
+    out.append(safe[prev:])
+    return "".join(out)
 
 # === CALL HISTORY (optional) ===
+_DIRECTION_MAP = {"0": "Outgoing", "2": "Incoming", "3": "Missed"}
+_STATUS_SUBSTRINGS = (("answer", "Answered"), ("cancel", "Canceled"),
+                      ("forbid", "Forbidden"), ("busy", "Busy"))
+
+def norm_status(s: str) -> str:
+    s = s.lower()
+    for sub, label in _STATUS_SUBSTRINGS:
+        if s.find(sub) != -1:
+            return label
+    return s.title() if s else "Other"
+
 def parse_calls_from_ini(path: str):
     calls = []
     if not os.path.exists(path):
@@ -134,76 +223,152 @@ def parse_calls_from_ini(path: str):
     in_calls = False
     raw_seen = 0
     with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        for raw in f:
-            line = raw.rstrip("\n")
-            compact = clean_line(line)
-            if not compact:
+        for raw in f.read().splitlines():
+            line = raw.strip()
+            if not line:
                 continue
-            if compact.startswith("[") and compact.endswith("]"):
-                sec = compact[1:-1].lower()
+            if line.startswith("[") and line.endswith("]"):
+                sec = line[1:-1].strip().lower()
                 if sec == "calls":
                     in_calls = True
                     continue
                 if in_calls:
                     break
-            if not in_calls or "=" not in compact:
+            if not in_calls:
                 continue
-            _, val = compact.split("=", 1)
+            idx = line.find("=")
+            if idx < 0:
+                continue
+            val = line[idx + 1:].strip()
             if not val or val.lower() == "null":
                 continue
             raw_seen += 1
-            parts = val.split(";")
+            parts = val.split(";", 6)  # stop splitting past the fields we use
             if len(parts) < 6:
                 continue
             phone_raw, disp, direction, epoch_str, duration, status = parts[:6]
             phone = norm_phone(phone_raw)
-            epoch_digits = "".join(ch for ch in epoch_str if ch.isdigit())
+            epoch_digits = norm_phone(epoch_str)
             if not epoch_digits:
                 continue
             try:
                 epoch = int(epoch_digits)
-                dt = datetime.fromtimestamp(epoch)
             except Exception:
                 continue
+            status = status.strip()
             calls.append({
                 "phone": phone,
                 "disp": disp,
                 "direction": direction,
                 "epoch": epoch,
-                "dt": dt,
                 "duration": duration,
-                "status": status.strip()
+                "status": status,
+                "status_norm": norm_status(status)  # classified once at parse
             })
     log(f"Parsed {len(calls)} calls total (raw seen {raw_seen})")
     return calls
 
-def stats_for_number(phone: str, calls: list):
-    phone = norm_phone(phone)
-    stats, statuses = {}, {}
-    direction_map = {"0": "Outgoing", "2": "Incoming", "3": "Missed"}
-    today = datetime.now().date()
-    week_ago = datetime.now() - timedelta(days=7)
-
-    def norm_status(s: str) -> str:
-        s = s.lower()
-        if "answer" in s:   return "Answered"
-        if "cancel" in s:   return "Canceled"
-        if "forbid" in s:   return "Forbidden"
-        if "busy" in s:     return "Busy"
-        return s.title() if s else "Other"
+def parse_calls_from_ini_cached(path: str):
+    """Memoize parse_calls_from_ini on the ini's mtime via a pickle sidecar."""
+    if not os.path.exists(path):
+        return parse_calls_from_ini(path)
+    mtime_ns = os.stat(path).st_mtime_ns
+    cache_path = path + ".cache.pkl"
+    try:
+        with open(cache_path, "rb") as f:
+            cached_mtime_ns, calls = pickle.load(f)
+        if cached_mtime_ns == mtime_ns:
+            log(f"Loaded {len(calls)} calls from cache {cache_path}")
+            return calls
+    except Exception:
+        pass
+    calls = parse_calls_from_ini(path)
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((mtime_ns, calls), f, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        pass
+    return calls
 
+def index_calls_by_suffix(calls: list):
+    """Bucket calls by their last-10-digit suffix so lookups skip the full list."""
+    by_suffix10 = defaultdict(list)
     for c in calls:
-        if not c["phone"].endswith(phone):
-            continue
-        label = direction_map.get(c["direction"], "Other")
+        by_suffix10[c["phone"][-10:]].append(c)
+    return by_suffix10
+
+# above this many matching calls, counting with NumPy masks beats the loop
+_VECTORIZE_MIN_CALLS = 2000
+
+def _stats_vectorized(candidates, direction_map, today_start, today_end, week_ago):
+    """NumPy mask-counting path for large histories; None if numpy is absent."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    n = len(candidates)
+    epochs = np.fromiter((c["epoch"] for c in candidates), dtype=np.int64, count=n)
+    dirs = np.array([c["direction"] for c in candidates])
+    today_mask = (epochs >= today_start) & (epochs < today_end)
+    week_mask = epochs >= week_ago
+    stats = {}
+    known = np.zeros(n, dtype=bool)
+    for code, label in direction_map.items():
+        dmask = dirs == code
+        known |= dmask
+        total = int(np.count_nonzero(dmask))
+        if total:
+            stats[label] = {
+                "today": int(np.count_nonzero(dmask & today_mask)),
+                "week":  int(np.count_nonzero(dmask & week_mask)),
+                "total": total,
+            }
+    other = ~known
+    total = int(np.count_nonzero(other))
+    if total:
+        stats["Other"] = {
+            "today": int(np.count_nonzero(other & today_mask)),
+            "week":  int(np.count_nonzero(other & week_mask)),
+            "total": total,
+        }
+    return stats
+
+def stats_for_number(phone: str, calls: list, by_suffix10=None, with_statuses=False):
+    phone = norm_phone(phone)
+    stats, statuses = {}, {}
+    now = datetime.now()
+    today_start = int(datetime(now.year, now.month, now.day).timestamp())
+    today_end = today_start + 86400
+    week_ago = int((now - timedelta(days=7)).timestamp())
+
+    if by_suffix10 is None:
+        by_suffix10 = index_calls_by_suffix(calls)
+    candidates = by_suffix10.get(phone[-10:], ())
+    if len(phone) > 10:
+        candidates = [c for c in candidates if c["phone"].endswith(phone)]
+
+    if len(candidates) > _VECTORIZE_MIN_CALLS:
+        vec = _stats_vectorized(candidates, _DIRECTION_MAP, today_start, today_end, week_ago)
+        if vec is not None:
+            if with_statuses:
+                for c in candidates:
+                    st = c.get("status_norm") or norm_status(c["status"])
+                    statuses[st] = statuses.get(st, 0) + 1
+            return vec, statuses
+
+    for c in candidates:
+        label = _DIRECTION_MAP.get(c["direction"], "Other")
         stats.setdefault(label, {"today": 0, "week": 0, "total": 0})
         stats[label]["total"] += 1
-        if c["dt"].date() == today:
+        epoch = c["epoch"]
+        if today_start <= epoch < today_end:
             stats[label]["today"] += 1
-        if c["dt"] >= week_ago:
+        if epoch >= week_ago:
             stats[label]["week"] += 1
-        st = norm_status(c["status"])
-        statuses[st] = statuses.get(st, 0) + 1
+        if with_statuses:
+            # pickle caches from before status_norm existed may lack the key
+            st = c.get("status_norm") or norm_status(c["status"])
+            statuses[st] = statuses.get(st, 0) + 1
     return stats, statuses
 
 # === IMAGINARY DB LOOKUP ===
@@ -222,7 +387,8 @@ def fetch_person_by_phone(phone: str):
     prof = PROFILES.get(cid, {})
     svcs = SERVICES.get(cid, [])
     lbls = LABELS.get(cid, [])
-    unpaid = sum((row["amount"] for row in svcs if not row.get("paid", False)), 0.0)
+    first = prof.get("owner_first") or ""
+    last  = prof.get("owner_last") or ""
     info.update({
         "customer_id": cid,
         "business_name": cust.get("business_name"),
@@ -230,11 +396,11 @@ def fetch_person_by_phone(phone: str):
         "program_name": cust.get("program"),
         "vat": prof.get("vat"),
         "email": prof.get("email"),
-        "owner_full": " ".join([prof.get("owner_first",""), prof.get("owner_last","")]).strip(),
+        "owner_full": f"{first} {last}" if first and last else (first or last),
         "notes": prof.get("notes"),
         "tags": lbls[:],
         "services": svcs[:],
-        "unpaid_total": unpaid,
+        "unpaid_total": _UNPAID_BY_CID.get(cid, 0.0),
     })
     log(f"[DEMO] Business: {info['business_name']} | Sector: {info['sector']} | Program: {info['program_name']}")
     log(f"[DEMO] VAT: {info['vat']} | Email: {info['email']} | Owner: {info['owner_full']}")
@@ -252,40 +418,111 @@ def ddg_top3_greek(phone: str):
         (f"{num} Αναζήτηση τηλεφώνου — πιθανός πελάτης", "https://example.com/reverse-lookup"),
     ]
 
-def write_unknown_csv(phone: str, web_results):
-    need_header = not os.path.exists(CSV_PATH)
-    with open(CSV_PATH, "a", encoding="utf-8-sig", newline="") as f:
-        w = csv.writer(f)
-        if need_header:
-            w.writerow(["timestamp","phone","title1","url1","title2","url2","title3","url3"])
+class _UnknownCSVWriter:
+    """Holds unknown_calls.csv open for the process so bursts of unknown
+    calls cost one open() total instead of open/close per row."""
+
+    HEADER = ["timestamp","phone","title1","url1","title2","url2","title3","url3"]
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._writer = None
+
+    def _ensure_open(self):
+        if self._writer is None:
+            need_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            self._file = open(self.path, "a", encoding="utf-8-sig", newline="", buffering=8192)
+            self._writer = csv.writer(self._file)
+            if need_header:
+                self._writer.writerow(self.HEADER)
+
+    @staticmethod
+    def _row(phone: str, web_results):
         fixed = (web_results or [])[:3]
         fixed += [("", "")] * (3 - len(fixed))
         row = [datetime.now().isoformat(), norm_phone(phone)]
         for title, url in fixed:
             row.extend([title, url])
-        w.writerow(row)
+        return row
+
+    def write(self, phone: str, web_results):
+        self._ensure_open()
+        self._writer.writerow(self._row(phone, web_results))
+        self._file.flush()
+
+    def writerows(self, entries):
+        """Bulk variant: entries is an iterable of (phone, web_results)."""
+        self._ensure_open()
+        self._writer.writerows(self._row(p, r) for p, r in entries)
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+            self._writer = None
+
+_unknown_csv = _UnknownCSVWriter(CSV_PATH)
+atexit.register(_unknown_csv.close)
+
+def write_unknown_csv(phone: str, web_results):
+    _unknown_csv.write(phone, web_results)
     log(f"[CSV] Logged unknown {phone} -> {CSV_PATH}")
 
 # === AVATAR HELPERS ===
 def program_color(name: str) -> QColor:
+    from PySide6.QtGui import QColor
     hexcol = PROGRAM_COLORS.get(name or "Unknown", PROGRAM_COLORS["Unknown"])
     return QColor(hexcol)
 
+def _load_scaled_pixmap(path: str, size: int) -> QPixmap:
+    # QPixmapCache is Qt-native and bounded: shared across widgets, and the
+    # painter can skip re-uploading cached textures on re-exposure
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QPixmap, QPixmapCache
+    key = f"avatar:{path}:{size}"
+    pm = QPixmap()
+    if QPixmapCache.find(key, pm):
+        return pm
+    pm = QPixmap(path).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    QPixmapCache.insert(key, pm)
+    return pm
+
 def pixmap_for_program(name: str, size=56) -> QPixmap:
+    from PySide6.QtGui import QPixmap
     path = IMG_BY_PROGRAM.get(name or "", "")
-    pm = QPixmap(size, size)
     if path and os.path.exists(path):
-        pm = QPixmap(path).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-    else:
-        pm.fill(program_color(name))
+        return _load_scaled_pixmap(path, size)
+    pm = QPixmap(size, size)
+    pm.fill(program_color(name))
     return pm
 
 def pixmap_for_unknown(size=56) -> QPixmap:
+    from PySide6.QtGui import QColor, QPixmap
     if os.path.exists(IMG_UNKNOWN):
-        return QPixmap(IMG_UNKNOWN).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return _load_scaled_pixmap(IMG_UNKNOWN, size)
     pm = QPixmap(size, size); pm.fill(QColor("#dddddd")); return pm
 
 # === HTML RENDERING ===
+_TAG_PILL_TMPL = (
+    "<span style='display:inline-block; padding:3px 10px; border-radius:14px; "
+    "font-size:" + _FS11 + "; font-weight:600; border:1px solid #2b2b2b; "
+    "background:{col}; color:#101010;'>&nbsp;{name}&nbsp;</span>"
+)
+
+_SVC_ROW_TMPL = (
+    "<tr style='line-height:0.95;'>"
+    "<td style='padding:2px 8px 2px 0;'>{desc}</td>"
+    "<td style='padding:2px 0; text-align:right; width:110px; font-weight:700; color:{color};'>{amt}</td>"
+    "<td style='padding:2px 8px; width:110px;'>{date}</td>"
+    "<td style='padding:2px 8px; width:52px;'>{paid}</td>"
+    "</tr>"
+)
+
 def render_tags_html(tags):
     if not tags:
         return ""
@@ -293,12 +530,7 @@ def render_tags_html(tags):
     for t in tags:
         name = html.escape(str(t.get("name", "")).strip())
         col  = (t.get("color") or "#f1f1f1").strip()
-        pill = (
-            f"<span style='display:inline-block; padding:3px 10px; border-radius:14px; "
-            f"font-size:{fs(11)}; font-weight:600; border:1px solid #2b2b2b; "
-            f"background:{col}; color:#101010;'>&nbsp;{name}&nbsp;</span>"
-        )
-        pills.append(pill)
+        pills.append(_TAG_PILL_TMPL.format(col=col, name=name))
     return "&nbsp;".join(pills)
 
 def render_services_table(services):
@@ -306,20 +538,16 @@ def render_services_table(services):
         return ""
     rows_html = []
     for r in services:
-        desc  = html.escape(r["desc"])
-        amt   = r["amount"]
-        date  = html.escape(r["date"])
-        paid  = "yes" if r.get("paid", False) else "no"
-        color = "#00cc66" if paid == "yes" else "#ff9900"
-        row = (
-            "<tr style='line-height:0.95;'>"
-            f"<td style='padding:2px 8px 2px 0;'>{desc}</td>"
-            f"<td style='padding:2px 0; text-align:right; width:110px; font-weight:700; color:{color};'>{html.escape(euro(amt))}</td>"
-            f"<td style='padding:2px 8px; width:110px;'>{date}</td>"
-            f"<td style='padding:2px 8px; width:52px;'>{paid}</td>"
-            "</tr>"
-        )
-        rows_html.append(row)
+        paid = "yes" if r.get("paid", False) else "no"
+        rows_html.append(_SVC_ROW_TMPL.format(
+            desc=_maybe_escape(r["desc"]),
+            # euro() yields only digits/€/separators and dates are ISO;
+            # neither can contain HTML-special chars
+            amt=euro(r["amount"]),
+            date=r["date"],
+            paid=paid,
+            color="#00cc66" if paid == "yes" else "#ff9900",
+        ))
 
     table = (
         "<table style='border-collapse:collapse; width:100%; font-size:{fsz}; color:#ddd; table-layout:fixed;'>"
@@ -335,32 +563,42 @@ def render_services_table(services):
         f"{''.join(rows_html)}"
         "</tbody>"
         "</table>"
-    ).format(fsz=fs(11))
+    ).format(fsz=_FS11)
     return table
 
+_DIR_LINE_TMPL = (
+    "<div style='margin:0 0 2px 0;'>"
+    "<span style='color:{lc}; font-size:" + _FS11 + ";'>{label}:</span> "
+    "<span style='color:#00bfff; font-size:" + _FS11 + ";'>T</span>"
+    "<span style='color:#00ff00; font-size:" + _FS11 + ";'> {today}</span> "
+    "<span style='color:#00bfff; font-size:" + _FS11 + ";'>W</span>"
+    "<span style='color:#00ff00; font-size:" + _FS11 + ";'> {week}</span>"
+    "</div>"
+)
+
 def render_direction_stats_columns(dir_stats):
-    blue  = "#00bfff"
-    green = "#00ff00"
     label_colors = {"Outgoing": "#a3ffcc", "Incoming": "#ffffff", "Missed": "#ffaaaa"}
     order = ["Outgoing", "Incoming", "Missed"]
     lines = []
     for label in order:
         d = dir_stats.get(label, {"today": 0, "week": 0, "total": 0})
-        lc = label_colors.get(label, "#cccccc")
-        lines.append(
-            f"<div style='margin:0 0 2px 0;'>"
-            f"<span style='color:{lc}; font-size:{fs(11)};'>{label}:</span> "
-            f"<span style='color:{blue}; font-size:{fs(11)};'>T</span>"
-            f"<span style='color:{green}; font-size:{fs(11)};'> {d.get('today', 0)}</span> "
-            f"<span style='color:{blue}; font-size:{fs(11)};'>W</span>"
-            f"<span style='color:{green}; font-size:{fs(11)};'> {d.get('week', 0)}</span>"
-            f"</div>"
-        )
+        lines.append(_DIR_LINE_TMPL.format(
+            lc=label_colors.get(label, "#cccccc"),
+            label=label,
+            today=d.get("today", 0),
+            week=d.get("week", 0),
+        ))
     return "".join(lines)
 
 # === TOAST ===
-def show_toast(phone: str, dir_stats: dict, status_stats: dict, web_results=None, person=None):
-    app = QApplication(sys.argv)
+def show_toast(phone: str, dir_stats: dict, web_results=None, person=None):
+    from PySide6.QtCore import Qt, QTimer
+    from PySide6.QtWidgets import (
+        QApplication, QWidget, QVBoxLayout, QLabel, QPushButton,
+        QHBoxLayout, QSizePolicy
+    )
+
+    app = QApplication.instance() or QApplication(sys.argv)
 
     flags = Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
     toast = QWidget(None, flags)
@@ -380,11 +618,9 @@ def show_toast(phone: str, dir_stats: dict, status_stats: dict, web_results=None
         finally:
             finish()
 
-    # Card + shadow
+    # Card; depth comes from the stylesheet border instead of a
+    # QGraphicsDropShadowEffect, which forces an offscreen blur per repaint
     card = QWidget(toast); card.setObjectName("card")
-    shadow = QGraphicsDropShadowEffect(blurRadius=22, xOffset=0, yOffset=6)
-    shadow.setColor(Qt.black)
-    card.setGraphicsEffect(shadow)
 
     outer = QVBoxLayout(toast); outer.setContentsMargins(0, 0, 0, 0); outer.addWidget(card)
     layout = QVBoxLayout(card); layout.setContentsMargins(14, 14, 14, 14); layout.setSpacing(8)
@@ -425,40 +661,41 @@ def show_toast(phone: str, dir_stats: dict, status_stats: dict, web_results=None
 
         header_line = f"{html.escape(epon)}"
         if prog:
-            header_line += f" <span style='color:#9de39d; font-size:{fs(11)};'>( {html.escape(prog)} )</span>"
+            header_line += f" <span style='color:#9de39d; font-size:{_FS11};'>( {html.escape(prog)} )</span>"
         if sector:
-            header_line += f" <span style='color:#9ddfff; font-size:{fs(11)};'>[{html.escape(sector)}]</span>"
-        header_line += f" <span style='color:#ffb347; font-size:{fs(12)}; font-weight:bold;'> | Owes: {html.escape(euro(owes))}</span>"
+            header_line += f" <span style='color:#9ddfff; font-size:{_FS11};'>[{html.escape(sector)}]</span>"
+        header_line += f" <span style='color:#ffb347; font-size:{_FS12}; font-weight:bold;'> | Owes: {euro(owes)}</span>"
 
-        person_html += f"<span style='color:#dbeafe; font-size:18px; font-weight:bold;'>{header_line}</span><br>"
+        # accumulate once into a list; repeated += on str reallocates every time
+        parts = [f"<span style='color:#dbeafe; font-size:18px; font-weight:bold;'>{header_line}</span><br>"]
 
         sub = []
         if owner: sub.append(f"Owner: {html.escape(owner)}")
         if vat:   sub.append(f"VAT: {html.escape(vat)}")
         if email: sub.append(f"Email: {html.escape(email)}")
         if sub:
-            person_html += f"<span style='color:#cdd6f4; font-size:{fs(11)};'>{' | '.join(sub)}</span><br>"
+            parts.append(f"<span style='color:#cdd6f4; font-size:{_FS11};'>{' | '.join(sub)}</span><br>")
 
         if notes_short:
-            person_html += f"<span style='color:{accent_label}; font-size:{fs(12)}; font-weight:bold;'>Note:</span> " \
-                           f"<span style='color:#cccccc; font-size:{fs(12)};'>{html.escape(notes_short)}</span><br>"
+            parts.append(f"<span style='color:{accent_label}; font-size:{_FS12}; font-weight:bold;'>Note:</span> "
+                         f"<span style='color:#cccccc; font-size:{_FS12};'>{html.escape(notes_short)}</span><br>")
 
         tags_html = render_tags_html(person.get("tags") or [])
         if tags_html:
-            person_html += f"<div style='margin-top:6px;'>{tags_html}</div>"
+            parts.append(f"<div style='margin-top:6px;'>{tags_html}</div>")
 
         services_html = render_services_table(person.get("services") or [])
         if services_html:
-            person_html += f"<div style='margin-top:6px;'>{services_html}</div>"
+            parts.append(f"<div style='margin-top:6px;'>{services_html}</div>")
 
         right_stats = render_direction_stats_columns(dir_stats or {})
-        bottom_html = (
+        parts.append(
             "<div style='margin-top:6px; display:block;'>"
-            f"<div style='color:#ffcc99; font-size:{fs(12)}; font-weight:700;'>Unpaid total: {html.escape(euro(owes))}</div>"
+            f"<div style='color:#ffcc99; font-size:{_FS12}; font-weight:700;'>Unpaid total: {euro(owes)}</div>"
             f"{right_stats}"
             "</div>"
         )
-        person_html += bottom_html
+        person_html = "".join(parts)
     else:
         # Unknown-caller layout
         phone_str = html.escape(phone)
@@ -500,7 +737,7 @@ def show_toast(phone: str, dir_stats: dict, status_stats: dict, web_results=None
     layout.addLayout(btn_row)
 
     toast.setStyleSheet("""
-    #card { background:#1f1f1f; border-radius:16px; }
+    #card { background:#1f1f1f; border-radius:16px; border:1px solid #0a0a0a; }
     QPushButton { background:#2b2b2b; color:white; border:1px solid #3a3a3a;
                   padding:6px 12px; border-radius:10px; font-size:13px; }
     QPushButton:hover { background:#343434; }
@@ -527,8 +764,15 @@ def show_toast(phone: str, dir_stats: dict, status_stats: dict, web_results=None
 # === MAIN ===
 def main():
     log(f"Launching toast for {PHONE}")
-    calls = parse_calls_from_ini(INI_PATH)
-    dir_stats, status_stats = stats_for_number(PHONE, calls)
+    # Parse the ini on a worker thread while the main thread pays the Qt
+    # import + QApplication construction cost; show_toast reuses the instance.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        calls_future = pool.submit(parse_calls_from_ini_cached, INI_PATH)
+        from PySide6.QtWidgets import QApplication
+        QApplication.instance() or QApplication(sys.argv)
+        calls = calls_future.result()
+    by_suffix10 = index_calls_by_suffix(calls)
+    dir_stats, _ = stats_for_number(PHONE, calls, by_suffix10)
 
     person = fetch_person_by_phone(PHONE)
     known = bool(person and person.get("customer_id"))
@@ -541,7 +785,7 @@ def main():
     if not dir_stats and not web_results and not known:
         log("No local stats, no web notes, and no customer match.")
 
-    show_toast(PHONE, dir_stats, status_stats, web_results, person)
+    show_toast(PHONE, dir_stats, web_results, person)
 
 if __name__ == "__main__":
     main()